@@ -1,22 +1,29 @@
 from __future__ import annotations
 
+import functools
 import json
+import mmap
 import os
+import re
+import stat
+import tomllib
 from pathlib import Path
-from typing import Any, Mapping, MutableMapping
+from typing import TYPE_CHECKING, Any, Mapping, MutableMapping
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
-try:  # Python 3.11+
-    import tomllib as tomli  # type: ignore[no-redef]
-except ModuleNotFoundError:  # pragma: no cover
-    import tomli  # type: ignore[no-redef]
+from . import __version__
 
-import tomli_w
-from platformdirs import PlatformDirs
+if TYPE_CHECKING:
+    from platformdirs import PlatformDirs
 
 APP_NAME = "python-cli"
 ENV_PREFIX = "PYTHON_CLI__"
+CONFIG_CACHE_NAME = "config.pkl"
+CONFIG_SCHEMA_URL = (
+    "https://raw.githubusercontent.com/byteowlz/schemas/refs/heads/main/"
+    "python-cli/python-cli.config.schema.json"
+)
 
 
 @dataclass(slots=True)
@@ -47,7 +54,31 @@ class AppConfig:
     run: RunConfig = field(default_factory=RunConfig)
 
 
-DEFAULT_CONFIG_TOML = """\
+_INT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}|\$(\w+)")
+
+_SECTION_TYPES: dict[str, type] = {
+    "logging": LoggingConfig,
+    "output": OutputConfig,
+    "run": RunConfig,
+}
+
+_SECTION_FIELDS: tuple[tuple[str, tuple[str, ...]], ...] = tuple(
+    (section, tuple(option.name for option in fields(section_type)))
+    for section, section_type in _SECTION_TYPES.items()
+)
+
+# Every PYTHON_CLI__<SECTION>__<FIELD> variable the schema understands.
+_ENV_KEY_MAP: dict[str, tuple[str, str]] = {
+    f"{ENV_PREFIX}{section.upper()}__{option.name.upper()}": (section, option.name)
+    for section, section_type in _SECTION_TYPES.items()
+    for option in fields(section_type)
+}
+
+
+DEFAULT_CONFIG_TOML = f"#:schema {CONFIG_SCHEMA_URL}\n\n" + """\
 # Default configuration for python-cli.
 # Copy this file to {config_path} to customize.
 
@@ -70,55 +101,59 @@ profile = "default"
 """
 
 
+@functools.lru_cache(maxsize=1)
 def default_dirs() -> PlatformDirs:
+    from platformdirs import PlatformDirs
+
     return PlatformDirs(appname=APP_NAME, appauthor=False)
 
 
 def default_config_path(env: Mapping[str, str] | None = None) -> Path:
-    env = env or os.environ
-    base = env.get("XDG_CONFIG_HOME")
-    if base:
-        return _expand_path(base, env) / APP_NAME / "config.toml"
-    return Path(default_dirs().user_config_dir) / "config.toml"
+    return _app_dir("XDG_CONFIG_HOME", "user_config_dir", env) / "config.toml"
 
 
 def default_data_dir(env: Mapping[str, str] | None = None) -> Path:
-    env = env or os.environ
-    base = env.get("XDG_DATA_HOME")
-    if base:
-        return _expand_path(base, env) / APP_NAME
-    return Path(default_dirs().user_data_dir)
+    return _app_dir("XDG_DATA_HOME", "user_data_dir", env)
 
 
 def default_state_dir(env: Mapping[str, str] | None = None) -> Path:
-    env = env or os.environ
-    base = env.get("XDG_STATE_HOME")
-    if base:
-        return _expand_path(base, env) / APP_NAME
-    return Path(default_dirs().user_state_dir)
+    return _app_dir("XDG_STATE_HOME", "user_state_dir", env)
 
 
 def default_cache_dir(env: Mapping[str, str] | None = None) -> Path:
-    env = env or os.environ
-    base = env.get("XDG_CACHE_HOME")
-    if base:
-        return _expand_path(base, env) / APP_NAME
-    return Path(default_dirs().user_cache_dir)
+    return _app_dir("XDG_CACHE_HOME", "user_cache_dir", env)
 
 
 def load_config(path: Path | None, env: Mapping[str, str]) -> tuple[AppConfig, Path]:
-    resolved_path = path if path is not None else default_config_path(env)
+    default_path = default_config_path(env)
+    resolved_path = path if path is not None else default_path
+
+    file_exists = resolved_path.exists()
+    env_overrides = _environment_overrides(env)
+    if not file_exists and not env_overrides:
+        return _default_app_config(), resolved_path
+
+    cache_path: Path | None = None
+    cache_key: tuple[Any, ...] | None = None
+    if resolved_path.parent == default_path.parent:
+        cache_key = _config_cache_key(resolved_path, env)
+        if cache_key is not None:
+            cache_path = default_cache_dir(env) / CONFIG_CACHE_NAME
+            cached = _read_config_cache(cache_path, cache_key)
+            if cached is not None:
+                return cached, resolved_path
 
     merged: dict[str, Any] = _defaults_dict()
-    if resolved_path.exists():
-        data = tomli.loads(resolved_path.read_text())
-        _deep_update(merged, data)
+    if file_exists:
+        data = _read_toml(resolved_path)
+        _merge_sections(merged, data)
 
-    env_overrides = _environment_overrides(env)
     if env_overrides:
-        _deep_update(merged, env_overrides)
+        _merge_sections(merged, env_overrides)
 
     config = _decode_app_config(merged)
+    if cache_path is not None and cache_key is not None:
+        _write_config_cache(cache_path, cache_key, config)
     return config, resolved_path
 
 
@@ -141,26 +176,18 @@ def ensure_default_config(
 
 
 def config_as_dict(config: AppConfig) -> dict[str, Any]:
-    return {
-        "logging": {
-            "level": config.logging.level,
-            "file": str(config.logging.file) if config.logging.file else "",
-            "json": config.logging.json,
-        },
-        "output": {
-            "color": config.output.color,
-            "no_progress": config.output.no_progress,
-        },
-        "run": {
-            "default_task": config.run.default_task,
-            "profile": config.run.profile,
-            "timeout_seconds": config.run.timeout_seconds,
-            "parallelism": config.run.parallelism,
-        },
-    }
+    data: dict[str, Any] = {}
+    for section, names in _SECTION_FIELDS:
+        values = getattr(config, section)
+        data[section] = {name: getattr(values, name) for name in names}
+    log_file = config.logging.file
+    data["logging"]["file"] = str(log_file) if log_file else ""
+    return data
 
 
 def dump_config(config: AppConfig) -> str:
+    import tomli_w
+
     data = config_as_dict(config)
     return tomli_w.dumps(data)
 
@@ -185,53 +212,104 @@ def _defaults_dict() -> dict[str, Any]:
     }
 
 
-def _deep_update(base: MutableMapping[str, Any], updates: Mapping[str, Any]) -> None:
+def _read_toml(path: Path) -> dict[str, Any]:
+    with path.open("rb") as fh:
+        st = os.fstat(fh.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            # Pipes and FIFOs report no size and cannot be mapped.
+            return tomllib.loads(fh.read().decode("utf-8"))
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Decode straight from the mapped pages; tomllib only accepts str.
+            return tomllib.loads(str(mapped, "utf-8"))
+
+
+def _config_cache_key(path: Path, env: Mapping[str, str]) -> tuple[Any, ...] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    overrides = tuple((key, env[key]) for key in _ENV_KEY_MAP if key in env)
+    # Decoding expands "~" in logging.file, and upgrades may change defaults or
+    # the schema, so those inputs are part of the key too.
+    return (
+        str(path),
+        st.st_mtime_ns,
+        st.st_size,
+        overrides,
+        os.path.expanduser("~"),
+        __version__,
+        _SECTION_FIELDS,
+    )
+
+
+def _read_config_cache(cache_path: Path, key: tuple[Any, ...]) -> AppConfig | None:
+    import pickle  # deferred: only paid when a config file exists
+
+    try:
+        with cache_path.open("rb") as fh:
+            cached_key, config = pickle.load(fh)
+    except Exception:  # missing, corrupt, or written by an incompatible version
+        return None
+    if cached_key != key or not isinstance(config, AppConfig):
+        return None
+    return config
+
+
+def _write_config_cache(cache_path: Path, key: tuple[Any, ...], config: AppConfig) -> None:
+    import pickle
+    import tempfile
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump((key, config), fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass  # the cache is an optimisation; never fail a command over it
+
+
+def _merge_sections(base: MutableMapping[str, Any], updates: Mapping[str, Any]) -> None:
+    # The schema is exactly section -> field, so a one-level merge suffices.
     for key, value in updates.items():
-        if (
-            isinstance(value, Mapping)
-            and key in base
-            and isinstance(base[key], MutableMapping)
-        ):
-            _deep_update(base[key], value)
+        section = base.get(key)
+        if isinstance(value, Mapping) and isinstance(section, MutableMapping):
+            section.update(value)
         else:
             base[key] = value
 
 
 def _environment_overrides(env: Mapping[str, str]) -> dict[str, Any]:
     overrides: dict[str, Any] = {}
-    prefix = ENV_PREFIX
-    for key, raw in env.items():
-        if not key.startswith(prefix):
-            continue
-        parts = key[len(prefix) :].strip("_").split("__")
-        if not parts:
-            continue
-        target = overrides
-        for segment in parts[:-1]:
-            segment_key = segment.lower()
-            target = target.setdefault(segment_key, {})  # type: ignore[assignment]
-        target[parts[-1].lower()] = _parse_env_value(raw)
+    for env_key, (section, option) in _ENV_KEY_MAP.items():
+        raw = env.get(env_key)
+        if raw is not None:
+            overrides.setdefault(section, {})[option] = _parse_env_value(raw)
     return overrides
 
 
 def _parse_env_value(raw: str) -> Any:
-    lowered = raw.lower()
+    stripped = raw.strip()
+    lowered = stripped.lower()
     if lowered in {"true", "false"}:
         return lowered == "true"
     if lowered in {"null", "none"}:
         return None
-    try:
-        return int(raw)
-    except ValueError:
-        pass
-    try:
-        return float(raw)
-    except ValueError:
-        pass
-    try:
-        return json.loads(raw)
-    except (json.JSONDecodeError, TypeError):
-        return raw
+    # Match before converting so plain strings never pay for a raised ValueError.
+    if _INT_RE.fullmatch(stripped):
+        return int(stripped)
+    if _FLOAT_RE.fullmatch(stripped):
+        return float(stripped)
+    if stripped[:1] in {"{", "[", '"'}:
+        try:
+            return json.loads(stripped)
+        except json.JSONDecodeError:
+            pass
+    return raw
 
 
 def _decode_app_config(data: Mapping[str, Any]) -> AppConfig:
@@ -272,8 +350,51 @@ def _coerce_optional_int(value: Any) -> int | None:
         return None
 
 
+def _app_dir(xdg_var: str, platform_attr: str, env: Mapping[str, str] | None) -> Path:
+    env = env or os.environ
+    base = env.get(xdg_var)
+    if not base:
+        return _platform_app_dir(platform_attr)
+    if "$" in base or base.startswith("~"):
+        return _expand_path(base, env) / APP_NAME
+    return _xdg_app_dir(base)
+
+
+@functools.lru_cache(maxsize=8)
+def _platform_app_dir(platform_attr: str) -> Path:
+    return Path(getattr(default_dirs(), platform_attr))
+
+
+@functools.lru_cache(maxsize=8)
+def _xdg_app_dir(base: str) -> Path:
+    # Only used for bases without $VARS or a leading "~" (which reads HOME).
+    return Path(base) / APP_NAME
+
+
 def _expand_path(raw: str, env: Mapping[str, str]) -> Path:
     expanded = os.path.expanduser(raw)
-    for key, value in env.items():
-        expanded = expanded.replace(f"${key}", value).replace(f"${{{key}}}", value)
+    expanded = _ENV_VAR_RE.sub(
+        lambda match: env.get(match.group(1) or match.group(2), match.group(0)),
+        expanded,
+    )
     return Path(expanded)
+
+
+def _section_args(config: AppConfig) -> tuple[tuple[str, type, tuple[Any, ...]], ...]:
+    args = []
+    for section, names in _SECTION_FIELDS:
+        values = getattr(config, section)
+        section_args = tuple(getattr(values, name) for name in names)
+        args.append((section, _SECTION_TYPES[section], section_args))
+    return tuple(args)
+
+
+# Default values per section in field order. They are all immutable, so
+# building a fresh config only has to rebuild the dataclass shells.
+_DEFAULT_SECTION_ARGS = _section_args(_decode_app_config(_defaults_dict()))
+
+
+def _default_app_config() -> AppConfig:
+    return AppConfig(
+        **{section: section_type(*args) for section, section_type, args in _DEFAULT_SECTION_ARGS}
+    )
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from pathlib import Path
 import time
 from typing import Any
 
@@ -37,9 +36,14 @@ def handle_init(ctx: RuntimeContext, opts: InitOptions) -> None:
             ctx.err_console.print("[yellow]Skipped[/] existing configuration.")
             return
 
+    # ensure_default_config creates the config directory; skip data/state dirs
+    # that resolve to the same path (only when the XDG bases are identical).
     ensure_default_config(config_path, force=True, env=ctx.env)
-    ctx.data_dir.mkdir(parents=True, exist_ok=True)
-    ctx.state_dir.mkdir(parents=True, exist_ok=True)
+    created = {config_path.parent}
+    for directory in (ctx.data_dir, ctx.state_dir):
+        if directory not in created:
+            directory.mkdir(parents=True, exist_ok=True)
+            created.add(directory)
 
     ctx.render(
         "Initialized configuration and data directories",
@@ -89,22 +93,18 @@ def handle_config_paths(ctx: RuntimeContext) -> None:
 
 
 def handle_config_schema(ctx: RuntimeContext) -> None:
-    schema_path = Path(__file__).parent.parent / "examples" / "config.schema.json"
-    if schema_path.exists():
-        ctx.console.print(schema_path.read_text())
-    else:
-        # Fall back to importlib.resources for installed packages
-        try:
-            from importlib.resources import files
-
-            schema = (
-                files("python_cli")
-                .joinpath("../examples/config.schema.json")
-                .read_text()
-            )
-            ctx.console.print(schema)
-        except Exception:
-            ctx.err_console.print("[red]Error:[/] config.schema.json not found")
+    from importlib.resources import files
+
+    # Read the schema shipped inside the package so installed (and compiled)
+    # wheels work; examples/ only exists in a source checkout.
+    try:
+        schema = (
+            files("python_cli").joinpath("config.schema.json").read_text(encoding="utf-8")
+        )
+    except OSError:
+        ctx.err_console.print("[red]Error:[/] config.schema.json not found")
+        return
+    ctx.console.print(schema)
 
 
 def handle_run(ctx: RuntimeContext, opts: RunOptions) -> None:
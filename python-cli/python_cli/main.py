@@ -208,6 +208,7 @@ def config_schema(ctx: Context) -> None:
 
 @app.command("completions")
 def completions(
+    ctx: Context,
     shell: str = typer.Argument(
         ...,
         metavar="SHELL",
@@ -219,10 +220,10 @@ def completions(
         raise typer.BadParameter(
             f"Unsupported shell: {shell}. Choose from {', '.join(SHELL_CHOICES)}."
         )
-    from typer.main import get_command
     from click.shell_completion import get_completion_class
 
-    command = get_command(app)
+    # Reuse the command tree Typer already built for this invocation.
+    command = ctx.find_root().command
     completion_class = get_completion_class(shell)
     env_var = f"_{APP_NAME.upper().replace('-', '_')}_COMPLETE"
     completer = completion_class(command, {}, command.name or APP_NAME, env_var)
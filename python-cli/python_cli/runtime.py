@@ -6,15 +6,29 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Any, Mapping
+from types import MappingProxyType
+from typing import Any, Literal, Mapping, cast
 
-import yaml
 from rich.console import Console
 
 from .config import AppConfig, config_as_dict, default_data_dir, default_state_dir, load_config
 from .logging_config import TRACE_LEVEL, configure_logging
 
 
+# Mirrors the Literal accepted by rich.console.Console(color_system=...).
+_ColorSystemName = Literal["auto", "standard", "256", "truecolor", "windows"]
+
+_LOG_LEVELS: dict[str, int] = {
+    "trace": TRACE_LEVEL,
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
 @dataclass(slots=True)
 class CommonFlags:
     config_path: Path | None = None
@@ -34,19 +48,17 @@ class CommonFlags:
     parallelism: int | None = None
 
     def resolve_log_level(self, config: AppConfig) -> int:
-        level = config.logging.level or "info"
-        level = level.lower()
-
         if self.trace:
             return TRACE_LEVEL
         if self.debug or self.verbose >= 2:
             return logging.DEBUG
-        if self.verbose == 1 and level in {"warning", "error", "critical"}:
+
+        level = _LOG_LEVELS.get((config.logging.level or "info").lower(), logging.INFO)
+        if self.verbose == 1 and level >= logging.WARNING:
             return logging.INFO
         if self.quiet:
             return logging.ERROR
-
-        return _level_from_string(level)
+        return level
 
     def resolve_timeout(self, config: AppConfig) -> int | None:
         return self.timeout_seconds if self.timeout_seconds else config.run.timeout_seconds
@@ -96,13 +108,12 @@ class RuntimeContext:
     def render(self, message: str, payload: Mapping[str, Any] | None = None) -> None:
         if self.output_format == "json":
             data = payload or {"message": message}
-            self.console.print_json(json.dumps(data))
+            self.console.out(_dump_json(data), highlight=False)
             return
 
         if self.output_format == "yaml":
             data = payload or {"message": message}
-            text = yaml.safe_dump(data, sort_keys=False)
-            self.console.print(text.rstrip())
+            self.console.out(_dump_yaml(data).rstrip(), highlight=False)
             return
 
         if self.flags.quiet:
@@ -138,10 +149,13 @@ def new_runtime(flags: CommonFlags, env: Mapping[str, str] | None = None) -> Run
         no_color=color_policy == "never",
         force_terminal=color_policy == "always",
     )
+    # force_terminal is never None here, so terminal detection cannot differ
+    # between the two streams; reuse stdout's color system instead of re-probing.
     err_console = Console(
         stderr=True,
-        no_color=color_policy == "never",
+        no_color=console.no_color,
         force_terminal=color_policy == "always",
+        color_system=cast("_ColorSystemName | None", console.color_system),
     )
 
     configure_logging(console=err_console, level=flags.resolve_log_level(config), diagnostics=flags.diagnostics)
@@ -161,18 +175,21 @@ def new_runtime(flags: CommonFlags, env: Mapping[str, str] | None = None) -> Run
         state_dir=state_dir,
         output_format=output_format,
         color_policy=color_policy,
-        env=dict(env),
+        env=MappingProxyType(env),
     )
 
 
-def _level_from_string(level: str) -> int:
-    mapping = {
-        "trace": TRACE_LEVEL,
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "warning": logging.WARNING,
-        "warn": logging.WARNING,
-        "error": logging.ERROR,
-        "critical": logging.CRITICAL,
-    }
-    return mapping.get(level.lower(), logging.INFO)
+def _dump_json(data: Mapping[str, Any]) -> str:
+    try:
+        import orjson  # type: ignore[import-not-found,unused-ignore]
+    except ModuleNotFoundError:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+def _dump_yaml(data: Mapping[str, Any]) -> str:
+    import yaml
+
+    # Use the libyaml emitter when PyYAML was built with it.
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(dict(data), Dumper=dumper, sort_keys=False)
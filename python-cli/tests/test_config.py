@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import os
+import threading
 from pathlib import Path
 
-from python_cli.config import CONFIG_SCHEMA_URL, ensure_default_config, load_config
+import pytest
+
+from python_cli import config as config_module
+from python_cli.config import (
+    CONFIG_SCHEMA_URL,
+    default_data_dir,
+    ensure_default_config,
+    load_config,
+)
 
 
 def test_load_config_applies_file_before_environment(tmp_path: Path) -> None:
@@ -43,3 +53,131 @@ def test_ensure_default_config_writes_schema_reference(tmp_path: Path) -> None:
     assert written == config_path
     assert content.startswith(f'#:schema {CONFIG_SCHEMA_URL}')
     assert "[logging]" in content
+
+
+def test_load_config_cache_invalidates_on_file_change(tmp_path: Path) -> None:
+    env = {
+        "XDG_CONFIG_HOME": str(tmp_path / "config"),
+        "XDG_CACHE_HOME": str(tmp_path / "cache"),
+    }
+    config_path = tmp_path / "config" / "python-cli" / "config.toml"
+    config_path.parent.mkdir(parents=True)
+    config_path.write_text('[run]\nprofile = "first"\n', encoding="utf-8")
+
+    first, _ = load_config(None, env)
+    assert (tmp_path / "cache" / "python-cli" / "config.pkl").exists()
+
+    # Same size and mtime but invalid TOML: only a cache hit can load this.
+    stat = config_path.stat()
+    config_path.write_text("!" * stat.st_size, encoding="utf-8")
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    cached, _ = load_config(None, env)
+    assert cached == first
+
+    config_path.write_text('[run]\nprofile = "second-value"\n', encoding="utf-8")
+    refreshed, _ = load_config(None, env)
+    assert refreshed.run.profile == "second-value"
+
+    overridden, _ = load_config(None, {**env, "PYTHON_CLI__RUN__PROFILE": "env"})
+    assert overridden.run.profile == "env"
+
+
+def _set_home(monkeypatch: pytest.MonkeyPatch, home: Path) -> None:
+    # os.path.expanduser reads HOME on POSIX and USERPROFILE on Windows.
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+
+
+def test_load_config_cache_is_keyed_by_home(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    env = {
+        "XDG_CONFIG_HOME": str(tmp_path / "config"),
+        "XDG_CACHE_HOME": str(tmp_path / "cache"),
+    }
+    config_path = tmp_path / "config" / "python-cli" / "config.toml"
+    config_path.parent.mkdir(parents=True)
+    config_path.write_text('[logging]\nfile = "~/app.log"\n', encoding="utf-8")
+
+    _set_home(monkeypatch, tmp_path / "alice")
+    alice, _ = load_config(None, env)
+    _set_home(monkeypatch, tmp_path / "bob")
+    bob, _ = load_config(None, env)
+
+    assert alice.logging.file == tmp_path / "alice" / "app.log"
+    assert bob.logging.file == tmp_path / "bob" / "app.log"
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_load_config_reads_non_regular_files(tmp_path: Path) -> None:
+    fifo = tmp_path / "config.fifo"
+    os.mkfifo(fifo)
+
+    def _write() -> None:
+        with fifo.open("w", encoding="utf-8") as fh:
+            fh.write('[run]\nprofile = "fromfifo"\n')
+
+    writer = threading.Thread(target=_write)
+    writer.start()
+    config, _ = load_config(fifo, {})
+    writer.join()
+
+    assert config.run.profile == "fromfifo"
+
+
+def test_default_data_dir_follows_home_for_tilde_bases(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    env = {"XDG_DATA_HOME": "~/data"}
+
+    _set_home(monkeypatch, tmp_path / "alice")
+    alice = default_data_dir(env)
+    _set_home(monkeypatch, tmp_path / "bob")
+    bob = default_data_dir(env)
+
+    assert alice == tmp_path / "alice" / "data" / "python-cli"
+    assert bob == tmp_path / "bob" / "data" / "python-cli"
+
+
+def test_load_config_parses_env_scalars(tmp_path: Path) -> None:
+    config_path = tmp_path / "missing.toml"
+
+    parsed, _ = load_config(
+        config_path,
+        {
+            "PYTHON_CLI__RUN__PARALLELISM": " 4 ",
+            "PYTHON_CLI__RUN__TIMEOUT_SECONDS": "null",
+            "PYTHON_CLI__LOGGING__JSON": "TRUE",
+        },
+    )
+    assert parsed.run.parallelism == 4
+    assert parsed.run.timeout_seconds is None
+    assert parsed.logging.json is True
+
+    padded, _ = load_config(
+        config_path,
+        {
+            "PYTHON_CLI__LOGGING__JSON": "false ",
+            "PYTHON_CLI__RUN__TIMEOUT_SECONDS": " null ",
+        },
+    )
+    assert padded.logging.json is False
+    assert padded.run.timeout_seconds is None
+
+    literal, _ = load_config(config_path, {"PYTHON_CLI__RUN__PROFILE": "1_000"})
+    assert literal.run.profile == "1_000"
+    assert config_module._parse_env_value("inf") == "inf"
+    assert config_module._parse_env_value("[not json") == "[not json"
+
+
+def test_default_data_dir_expands_env_references(tmp_path: Path) -> None:
+    env = {"BASE": str(tmp_path), "HOME": "/unused"}
+
+    braced = default_data_dir({**env, "XDG_DATA_HOME": "${BASE}/data"})
+    bare = default_data_dir({**env, "XDG_DATA_HOME": "$BASE/data"})
+    unknown = default_data_dir({**env, "XDG_DATA_HOME": "$HOMEX/data"})
+
+    assert braced == tmp_path / "data" / "python-cli"
+    assert bare == tmp_path / "data" / "python-cli"
+    # Whole-name matching: $HOMEX is not a partial $HOME substitution.
+    assert unknown == Path("$HOMEX/data/python-cli")
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from python_cli.config import AppConfig, LoggingConfig
+from python_cli.runtime import CommonFlags
+
+
+@pytest.mark.parametrize(
+    ("level", "expected"),
+    [
+        ("warn", logging.INFO),
+        ("warning", logging.INFO),
+        ("info", logging.INFO),
+        ("debug", logging.DEBUG),
+    ],
+)
+def test_single_verbose_flag_caps_level_at_info(level: str, expected: int) -> None:
+    config = AppConfig(logging=LoggingConfig(level=level))
+
+    assert CommonFlags(verbose=1).resolve_log_level(config) == expected